@@ -171,6 +171,8 @@ class BibleAdminGroup(app_commands.Group, name='bibleadmin'):
             bible_lookup.discard(existing.command)
             await session.delete(existing)
 
+        BibleVersion.clear_cache()
+
         await utils.send_embed(
             itx,
             description=f'Removed `{existing.command}`',
@@ -100,6 +100,8 @@ class Bible(Cog['Erasmus']):
         self.testing_server_preferences.initialize_from_parent(self)
 
     async def refresh(self, session: AsyncSession, /) -> None:
+        BibleVersion.clear_cache()
+        self.service_manager.clear_cache()
         bible_lookup.clear()
         bible_lookup.update(
             [
@@ -119,6 +121,7 @@ class Bible(Cog['Erasmus']):
 
     @override
     async def cog_unload(self) -> None:
+        BibleVersion.clear_cache()
         bible_lookup.clear()
 
         self.__daily_bread_task.cancel()
@@ -239,11 +242,17 @@ class Bible(Cog['Erasmus']):
         )
 
     async def lookup_from_message(self, message: discord.Message, /) -> None:
+        only_bracketed = (
+            self.bot.user
+            not in message.mentions  # pyright: ignore[reportUnnecessaryContains]
+        )
+
+        if only_bracketed and '[' not in message.content:
+            return
+
         try:
             verse_ranges = VerseRange.get_all_from_string(
-                message.content,
-                only_bracketed=self.bot.user
-                not in message.mentions,  # pyright: ignore[reportUnnecessaryContains]
+                message.content, only_bracketed=only_bracketed
             )
 
             if not verse_ranges:
@@ -39,6 +39,9 @@ _log: Final = logging.getLogger(__name__)
 _shared_cooldown: Final = app_commands.checks.cooldown(
     rate=2, per=60.0, key=lambda i: (i.guild_id, i.user.id)
 )
+_passage_strainer: Final = SoupStrainer(
+    class_=re.compile(re.WORD_BOUNDARY, 'rp-passage-display', re.WORD_BOUNDARY)
+)
 
 
 @frozen
@@ -86,20 +89,13 @@ class DailyBreadGroup(
             ) as response,
         ):
             text = await response.text(errors='replace')
-            strainer = SoupStrainer(
-                class_=re.compile(
-                    re.WORD_BOUNDARY,
-                    'rp-passage-display',
-                    re.WORD_BOUNDARY,
-                )
-            )
-            soup = BeautifulSoup(text, 'html.parser', parse_only=strainer)
+            soup = BeautifulSoup(text, 'html.parser', parse_only=_passage_strainer)
             passage_node = soup.select_one('.rp-passage-display')
 
             if passage_node is None:
                 raise DoNotUnderstandError
 
-            return VerseRange.from_string(passage_node.get_text(''))
+            return VerseRange.from_string(passage_node.get_text('').strip())
 
     def _get_fetcher(self, verse_range: VerseRange, /) -> PassageFetcher:
         if self._fetcher is None or self._fetcher.verse_range != verse_range:
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 from enum import Flag, auto
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Final, Self, TypedDict, override
+from typing import TYPE_CHECKING, Final, NamedTuple, Self, TypedDict, override
 
 import orjson
-from attrs import evolve, frozen
+from attrs import evolve, field, frozen
 from botus_receptus import re
-from more_itertools import unique_everseen
 
 from .exceptions import (
     BookMappingInvalid,
@@ -16,7 +16,7 @@ from .exceptions import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
     from re import Match, Pattern
 
     import discord
@@ -64,15 +64,15 @@ class SectionFlag(Flag):
 
     @property
     def book_names(self) -> Iterator[str]:
-        for section, book in _book_mask_map.items():
-            if section in self:
-                match book.name:
-                    case 'Genesis':
-                        yield 'Old Testament'
-                    case 'Matthew':
-                        yield 'New Testament'
-                    case _:
-                        yield book.name
+        mask = self.value
+
+        for section, name in _section_name_map.items():
+            if not mask:
+                break
+
+            if mask & section:
+                mask ^= section
+                yield name
 
     @staticmethod
     def _sanitize_book_name(book_name: str, /) -> str:
@@ -129,52 +129,56 @@ class Book:
         return book
 
 
-def __populate_maps() -> (
-    tuple[dict[str, Book], dict[str, Book], dict[SectionFlag, Book]]
-):
+def __populate_maps() -> tuple[dict[str, Book], dict[str, Book], dict[int, str]]:
     book_map: Final[dict[str, Book]] = {}
     osis_map: Final[dict[str, Book]] = {}
-    book_mask_map: Final[dict[SectionFlag, Book]] = {}
+    section_name_map: Final[dict[int, str]] = {}
 
-    with (Path(__file__).resolve().parent / 'data' / 'books.json').open() as f:
-        raw_books: list[_RawBookDict] = orjson.loads(f.read())
+    raw_books: list[_RawBookDict] = orjson.loads(
+        (Path(__file__).resolve().parent / 'data' / 'books.json').read_bytes()
+    )
 
-        for raw_book in raw_books:
-            osis: str = raw_book['osis']
-
-            if osis[0].isdecimal():
-                section = SectionFlag[f'{osis[1:]}_{osis[0]}']
-            else:
-                section = SectionFlag[osis]
+    for raw_book in raw_books:
+        osis: str = raw_book['osis']
 
-            book = Book(
-                raw_book['name'],
-                raw_book['osis'],
-                raw_book['paratext'],
-                frozenset(raw_book['alt']),
-                section,
-            )
+        if osis[0].isdecimal():
+            section = SectionFlag[f'{osis[1:]}_{osis[0]}']
+        else:
+            section = SectionFlag[osis]
+
+        book = Book(
+            raw_book['name'],
+            raw_book['osis'],
+            raw_book['paratext'],
+            frozenset(raw_book['alt']),
+            section,
+        )
 
-            if book.section not in book_mask_map:
-                book_mask_map[book.section] = book
+        if section.value not in section_name_map:
+            match section:
+                case SectionFlag.OT:
+                    section_name_map[section.value] = 'Old Testament'
+                case SectionFlag.NT:
+                    section_name_map[section.value] = 'New Testament'
+                case _:
+                    section_name_map[section.value] = book.name
 
-            osis_map[book.osis] = book
+        osis_map[book.osis] = book
 
-            for input_string in {book.name, book.osis} | book.alt:
-                book_map[input_string.lower()] = book
+        for input_string in {book.name, book.osis} | book.alt:
+            book_map[input_string.lower()] = book
 
-    return book_map, osis_map, book_mask_map
+    return book_map, osis_map, section_name_map
 
 
-_book_map, _osis_map, _book_mask_map = __populate_maps()
+_book_map, _osis_map, _section_name_map = __populate_maps()
 
 _book_map: Final
 _osis_map: Final
-_book_mask_map: Final
+_section_name_map: Final
 
 
-@frozen
-class Verse:
+class Verse(NamedTuple):
     chapter: int
     verse: int
 
@@ -183,63 +187,109 @@ class Verse:
         return f'{self.chapter}:{self.verse}'
 
 
+type _Trie = dict[str, _Trie]
+
+
+def _trie_to_pattern(trie: _Trie, /) -> str:
+    branches = [
+        re.escape(char) + _trie_to_pattern(child)
+        for char, child in trie.items()
+        if char
+    ]
+
+    if not branches:
+        return ''
+
+    pattern = branches[0] if len(branches) == 1 else re.either(*branches)
+
+    # An empty key marks the end of a name that is also the prefix of others
+    if '' in trie:
+        return re.optional(pattern)
+
+    return pattern
+
+
+def _names_to_pattern(names: Iterable[str], /) -> str:
+    trie: _Trie = {}
+
+    for name in names:
+        node = trie
+
+        for char in name:
+            node = node.setdefault(char, {})
+
+        node[''] = {}
+
+    return _trie_to_pattern(trie)
+
+
 # Inspired by
 # https://github.com/TehShrike/verse-reference-regex/blob/master/create-regex.js
+#
+# The book names are factored into a trie so the engine follows one branch per
+# character instead of trying each of the several hundred names in turn
 _book_re: Final = re.compile(
-    re.named_group('book')(
-        re.either(*re.escape_all(unique_everseen(_book_map.keys())))
-    ),
+    re.named_group('book')(_names_to_pattern(_book_map.keys())),
     re.optional(re.DOT),
 )
 
 _version_group: Final = re.named_group('version')
-_one_or_more_digit: Final = re.one_or_more(re.DIGIT)
-_colon: Final = re.combine(
-    re.any_number_of(re.WHITESPACE), ':', re.any_number_of(re.WHITESPACE)
-)
+
+# Possessive quantifiers never give back what they have consumed, so a near
+# miss fails without backtracking through every split of a run of digits or
+# whitespace
+_one_or_more_digit: Final = re.combine(re.DIGIT, '++')
+_one_or_more_whitespace: Final = re.combine(re.WHITESPACE, '++')
+_any_whitespace: Final = re.combine(re.WHITESPACE, '*+')
+_colon: Final = re.combine(_any_whitespace, ':', _any_whitespace)
 
 _reference_re: Final = re.compile(
     _book_re,
-    re.one_or_more(re.WHITESPACE),
+    _one_or_more_whitespace,
     re.named_group('chapter_start')(_one_or_more_digit),
     _colon,
     re.named_group('verse_start')(_one_or_more_digit),
     re.optional(
-        re.any_number_of(re.WHITESPACE),
+        _any_whitespace,
         '[',
         re.DASH,
         '\u2013',
         '\u2014',
         ']',
-        re.any_number_of(re.WHITESPACE),
+        _any_whitespace,
         re.optional(re.named_group('chapter_end')(_one_or_more_digit), _colon),
         re.named_group('verse_end')(_one_or_more_digit),
     ),
     flags=re.IGNORECASE,
 )
 
+# Every reference contains a "chapter:verse" pair, so this is used to reject
+# messages before scanning them with the (much larger) book name alternation
+_chapter_verse_re: Final = re.compile(re.DIGIT, _colon, re.DIGIT)
+
 _reference_with_version_re: Final = re.compile(
     _reference_re,
     re.optional(
-        re.any_number_of(re.WHITESPACE),
+        _any_whitespace,
         _version_group(re.one_or_more(re.ALPHANUMERICS)),
     ),
     flags=re.IGNORECASE,
 )
 
 _reference_or_bracketed_with_version_re: Final = re.compile(
-    re.optional(
-        re.named_group('bracket')(re.LEFT_BRACKET, re.any_number_of(re.WHITESPACE))
-    ),
+    re.optional(re.named_group('bracket')(re.LEFT_BRACKET, _any_whitespace)),
+    # Commit to the reference once it has matched (atomic group)
+    '(?>',
     _reference_re,
+    ')',
     re.if_group(
         'bracket',
         re.group(
             re.optional(
-                re.one_or_more(re.WHITESPACE),
+                _one_or_more_whitespace,
                 _version_group(re.one_or_more(re.ALPHANUMERICS)),
             ),
-            re.any_number_of(re.WHITESPACE),
+            _any_whitespace,
             re.RIGHT_BRACKET,
         ),
     ),
@@ -248,20 +298,27 @@ _reference_or_bracketed_with_version_re: Final = re.compile(
 
 _bracketed_reference_with_version_re: Final = re.compile(
     re.LEFT_BRACKET,
-    re.any_number_of(re.WHITESPACE),
+    _any_whitespace,
     _reference_with_version_re,
-    re.any_number_of(re.WHITESPACE),
+    _any_whitespace,
     re.RIGHT_BRACKET,
     flags=re.IGNORECASE,
 )
 
-_search_reference_re: Final = re.compile(
-    re.START, _reference_re, re.END, flags=re.IGNORECASE
-)
 
-_search_reference_with_version_re: Final = re.compile(
-    re.START, _reference_with_version_re, re.END, flags=re.IGNORECASE
-)
+@cache
+def _get_group_indices(
+    pattern: Pattern[str], /
+) -> tuple[tuple[int, int, int, int, int], int | None]:
+    groupindex = pattern.groupindex
+
+    return (
+        groupindex['book'],
+        groupindex['chapter_start'],
+        groupindex['verse_start'],
+        groupindex['chapter_end'],
+        groupindex['verse_end'],
+    ), groupindex.get('version')
 
 
 @frozen
@@ -270,6 +327,20 @@ class VerseRange:
     start: Verse
     end: Verse | None
     version: str | None
+    verses: str = field(init=False, eq=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        verses = str(self.start)
+
+        if self.end is not None:
+            if self.end.chapter == self.start.chapter:
+                verses += f'-{self.end.verse}'
+            else:
+                verses += f'-{self.end}'
+
+        # Instances are frozen, so the formatted verses are stored once here
+        # rather than being rebuilt every time the range is formatted
+        object.__setattr__(self, 'verses', verses)
 
     @property
     def book_mask(self) -> SectionFlag:
@@ -283,18 +354,6 @@ class VerseRange:
     def paratext(self) -> str | None:
         return self.book.paratext
 
-    @property
-    def verses(self, /) -> str:
-        verse = str(self.start)
-
-        if self.end is not None:
-            if self.end.chapter == self.start.chapter:
-                verse += f'-{self.end.verse}'
-            else:
-                verse += f'-{self.end}'
-
-        return verse
-
     def for_bible(self, bible: Bible, /) -> Self:
         if bible.book_mapping is not None and self.osis in bible.book_mapping:
             osis = bible.book_mapping[self.osis]
@@ -332,41 +391,44 @@ class VerseRange:
 
     @classmethod
     def from_string(cls, verse: str, /) -> Self:
-        if (match := _search_reference_re.match(verse)) is None:
+        if (match := _reference_re.fullmatch(verse)) is None:
             raise ReferenceNotUnderstoodError(verse)
 
         return cls.from_match(match)
 
     @classmethod
     def from_string_with_version(cls, verse: str, /) -> Self:
-        if (match := _search_reference_with_version_re.match(verse)) is None:
+        if (match := _reference_with_version_re.fullmatch(verse)) is None:
             raise ReferenceNotUnderstoodError(verse)
 
         return cls.from_match(match)
 
     @classmethod
     def from_match(cls, match: Match[str], /) -> Self:
-        groups = match.groupdict()
+        indices, version_index = _get_group_indices(match.re)
+        book, chapter_start_str, verse_start_str, chapter_end_str, end_str = (
+            match.group(*indices)
+        )
 
-        chapter_start_int = int(groups['chapter_start'])
-        start = Verse(chapter_start_int, int(groups['verse_start']))
+        chapter_start_int = int(chapter_start_str)
+        start = Verse(chapter_start_int, int(verse_start_str))
 
         end: Verse | None = None
-        end_str = groups['verse_end']
 
         if end_str is not None:
             end_int = int(end_str)
             chapter_end_int = chapter_start_int
 
-            chapter_end_str = groups['chapter_end']
             if chapter_end_str is not None:
                 chapter_end_int = int(chapter_end_str)
 
             end = Verse(chapter_end_int, end_int)
 
-        version: str | None = groups.get('version')
+        version: str | None = (
+            None if version_index is None else match.group(version_index)
+        )
 
-        return cls.create(groups['book'], start, end, version)
+        return cls.create(book, start, end, version)
 
     @classmethod
     def get_all_from_string(
@@ -380,14 +442,14 @@ class VerseRange:
         else:
             lookup_pattern = _reference_or_bracketed_with_version_re
 
-        if (match := lookup_pattern.search(string)) is not None:
-            while match:
-                try:
-                    ranges.append(cls.from_match(match))
-                except Exception as exc:  # noqa: BLE001
-                    ranges.append(exc)
+        if _chapter_verse_re.search(string) is None:
+            return ranges
 
-                match = lookup_pattern.search(string, match.end())
+        for match in lookup_pattern.finditer(string):
+            try:
+                ranges.append(cls.from_match(match))
+            except Exception as exc:  # noqa: BLE001
+                ranges.append(exc)
 
         return ranges
 
@@ -396,18 +458,27 @@ class VerseRange:
         return cls.from_string_with_version(value)
 
 
+# Service results repeat the same references across queries and pages.
+# VerseRange is frozen, so one parsed instance can be shared by all of them.
+@lru_cache(maxsize=4096)
+def verse_range_from_string(verse: str, /) -> VerseRange:
+    return VerseRange.from_string(verse)
+
+
 @frozen
 class Passage:
     text: str
     range: VerseRange
     version: str | None = None
+    citation: str = field(init=False, eq=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        citation = str(self.range)
 
-    @property
-    def citation(self, /) -> str:
         if self.version is not None:
-            return f'{self.range} ({self.version})'
+            citation = f'{citation} ({self.version})'
 
-        return str(self.range)
+        object.__setattr__(self, 'citation', citation)
 
     @override
     def __str__(self, /) -> str:
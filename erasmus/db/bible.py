@@ -1,11 +1,18 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 import pendulum
 from sqlalchemy import Computed, ForeignKey, Index, func, select, text
 from sqlalchemy.dialects.postgresql import JSONB, insert
-from sqlalchemy.orm import Mapped, declared_attr, foreign, mapped_column, relationship
+from sqlalchemy.orm import (
+    Mapped,
+    declared_attr,
+    foreign,
+    make_transient_to_detached,
+    mapped_column,
+    relationship,
+)
 
 from ..data import SectionFlag
 from ..exceptions import InvalidVersionError
@@ -16,9 +23,15 @@ if TYPE_CHECKING:
 
     import discord
     from botus_receptus.types import Coroutine
+    from sqlalchemy import ScalarSelect
     from sqlalchemy.ext.asyncio import AsyncSession
 
 
+# Detached copies of versions looked up by abbreviation for every bracketed
+# reference; cleared whenever the versions are refreshed from the database
+_abbr_cache: Final[dict[str, BibleVersion]] = {}
+
+
 class BibleVersion(Base):
     __tablename__ = 'bible_versions'
 
@@ -144,12 +157,46 @@ class BibleVersion(Base):
 
     @staticmethod
     async def get_by_abbr(session: AsyncSession, abbr: str, /) -> BibleVersion | None:
-        return (
+        key = abbr.lower()
+
+        if (cached := _abbr_cache.get(key)) is not None:
+            # Hand each session its own copy of the cached row without a query
+            return await session.merge(cached, load=False)
+
+        bible = (
             await session.scalars(
                 select(BibleVersion).where(BibleVersion.command.ilike(abbr))
             )
         ).first()
 
+        if bible is not None:
+            _abbr_cache[key] = bible.__detached_copy()
+
+        return bible
+
+    def __detached_copy(self) -> BibleVersion:
+        # The instance may already belong to the caller's session, so the cache
+        # gets a copy of its columns rather than the instance itself
+        copy = BibleVersion(
+            command=self.command,
+            name=self.name,
+            abbr=self.abbr,
+            service=self.service,
+            service_version=self.service_version,
+            rtl=self.rtl,
+            books=self.books,
+            book_mapping=self.book_mapping,
+        )
+        copy.id = self.id
+        copy.sortable_name = self.sortable_name
+        make_transient_to_detached(copy)
+
+        return copy
+
+    @staticmethod
+    def clear_cache() -> None:
+        _abbr_cache.clear()
+
     @staticmethod
     async def get_for(
         session: AsyncSession,
@@ -158,19 +205,42 @@ class BibleVersion(Base):
         user: discord.User | discord.Member | discord.Object | None = None,
         guild: discord.Guild | discord.Object | None = None,
     ) -> BibleVersion:
-        if user is not None:
-            user_pref = await session.get(UserPref, user.id)
+        # Resolve the user's, then the guild's, then the default version in a
+        # single round trip rather than fetching each preference in turn
+        bible_ids: list[ScalarSelect[int | None]] = []
 
-            if user_pref is not None and user_pref.bible_version is not None:
-                return user_pref.bible_version
+        if user is not None:
+            bible_ids.append(
+                select(UserPref.bible_id)
+                .where(UserPref.user_id == user.id)
+                .scalar_subquery()
+            )
 
         if guild is not None:
-            guild_pref = await session.get(GuildPref, guild.id)
+            bible_ids.append(
+                select(GuildPref.bible_id)
+                .where(GuildPref.guild_id == guild.id)
+                .scalar_subquery()
+            )
+
+        bible: BibleVersion | None = (
+            await session.scalars(
+                select(BibleVersion).where(
+                    BibleVersion.id
+                    == func.coalesce(
+                        *bible_ids,
+                        select(BibleVersion.id)
+                        .where(BibleVersion.command == 'esv')
+                        .scalar_subquery(),
+                    )
+                )
+            )
+        ).first()
 
-            if guild_pref is not None and guild_pref.bible_version is not None:
-                return guild_pref.bible_version
+        if bible is None:
+            raise InvalidVersionError('esv')
 
-        return await BibleVersion.get_by_command(session, 'esv')
+        return bible
 
 
 class _BibleVersionBase(Base):
@@ -171,8 +171,9 @@ class Erasmus(sa.AutoShardedBot, topgg.AutoShardedBot):
             case commands.NoPrivateMessage():
                 message_id = 'no-private-message'
             case app_commands.CommandOnCooldown():
-                retry_interval = (
-                    pendulum.now().add(seconds=int(error.retry_after)).diff()
+                now = pendulum.now(pendulum.UTC)
+                retry_interval = pendulum.interval(
+                    now, now.add(seconds=int(error.retry_after))
                 )
 
                 message_id = 'user-on-cooldown'
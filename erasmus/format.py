@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Final
 
 _roman_pairs: Final = tuple(
@@ -9,26 +10,29 @@ _roman_pairs: Final = tuple(
         strict=True,
     )
 )
+_roman_values: Final = {'M': 1000, 'D': 500, 'C': 100, 'L': 50, 'X': 10, 'V': 5, 'I': 1}
 
 
+@lru_cache(maxsize=128)
 def int_to_roman(number: int, /) -> str:
     numerals: list[str] = []
 
     for letter, value in _roman_pairs:
-        count, number = divmod(number, value)
-        numerals.append(letter * count)
+        if number >= value:
+            count, number = divmod(number, value)
+            numerals.append(letter * count)
 
     return ''.join(numerals)
 
 
+@lru_cache(maxsize=128)
 def roman_to_int(numerals: str, /) -> int:
-    numerals = numerals.upper()
-    index = result = 0
+    result = previous = 0
 
-    for letter, value in _roman_pairs:
-        while numerals[index : index + len(letter)] == letter:
-            result += value
-            index += len(letter)
+    for letter in reversed(numerals.upper()):
+        value = _roman_values[letter]
+        result += value if value >= previous else -value
+        previous = value
 
     return result
 
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, Final, TypeGuard, cast
 
 from attrs import field, frozen
 
 from . import services
+from .data import Passage, VerseRange
 from .exceptions import (
     ServiceLookupTimeout,
     ServiceNotSupportedError,
@@ -17,7 +19,7 @@ if TYPE_CHECKING:
     import aiohttp
 
     from .config import Config
-    from .data import Passage, SearchResults, VerseRange
+    from .data import SearchResults
     from .services.base_service import BaseService
     from .types import Bible, Service
 
@@ -32,6 +34,10 @@ def _is_service_cls(obj: object, /) -> TypeGuard[type[BaseService]]:
 class ServiceManager:
     service_map: dict[str, Service] = field(factory=dict)
     timeout: float = 10
+    cache_size: int = 128
+    _passage_cache: OrderedDict[tuple[int, VerseRange], Passage] = field(
+        init=False, factory=OrderedDict[tuple[int, VerseRange], Passage]
+    )
 
     def __contains__(self, key: str, /) -> bool:
         return key in self.service_map
@@ -39,21 +45,36 @@ class ServiceManager:
     def __len__(self, /) -> int:
         return len(self.service_map)
 
+    def clear_cache(self, /) -> None:
+        self._passage_cache.clear()
+
     async def get_passage(self, bible: Bible, verses: VerseRange, /) -> Passage:
         service = self.service_map.get(bible.service)
 
         if service is None:
             raise ServiceNotSupportedError(bible)
 
+        key = (bible.id, verses)
+
+        if (passage := self._passage_cache.get(key)) is not None:
+            self._passage_cache.move_to_end(key)
+            return passage
+
         try:
             _log.debug(f'Getting passage {verses} ({bible.abbr})')
             async with asyncio.timeout(self.timeout):
                 passage = await service.get_passage(bible, verses)
                 _log.debug(f'Got passage {passage.citation}')
-                return passage
         except TimeoutError as e:
             raise ServiceLookupTimeout(bible, verses) from e
 
+        self._passage_cache[key] = passage
+
+        if len(self._passage_cache) > self.cache_size:
+            self._passage_cache.popitem(last=False)
+
+        return passage
+
     async def search(
         self, bible: Bible, terms: list[str], /, *, limit: int = 20, offset: int = 0
     ) -> SearchResults:
@@ -9,7 +9,7 @@ from attrs import field, frozen
 from botus_receptus import re
 from yarl import URL
 
-from ..data import Passage, SearchResults, VerseRange
+from ..data import Passage, SearchResults, verse_range_from_string
 from ..exceptions import BookNotInVersionError, DoNotUnderstandError
 from ..json import get
 from .base_service import BaseService
@@ -18,9 +18,19 @@ if TYPE_CHECKING:
     import aiohttp
 
     from ..config import ServiceConfig
+    from ..data import VerseRange
     from ..types import Bible
 
 _img_re: Final = re.compile('src="', re.named_group('src')('[^"]+'), '"')
+_passage_query: Final = URL.build(
+    query={
+        'content-type': 'json',
+        'include-notes': 'false',
+        'include-titles': 'false',
+        'include-chapter-numbers': 'false',
+        'include-verse-numbers': 'true',
+    }
+).raw_query_string
 
 
 class _Text(TypedDict):
@@ -164,15 +174,7 @@ class ApiBible(BaseService):
                     bibleId=bible.service_version,
                     passageId=self.__get_passage_id(bible, verses),
                 )
-            ).with_query(
-                {
-                    'content-type': 'json',
-                    'include-notes': 'false',
-                    'include-titles': 'false',
-                    'include-chapter-numbers': 'false',
-                    'include-verse-numbers': 'true',
-                }
-            ),
+            ).with_query(_passage_query),
             headers=self.headers,
         ) as response:
             data = await self.__process_response(response)
@@ -209,7 +211,7 @@ class ApiBible(BaseService):
             passages = [
                 Passage(
                     text=self.replace_special_escapes(bible, verse['text']),
-                    range=VerseRange.from_string(verse['reference']),
+                    range=verse_range_from_string(verse['reference'].strip()),
                     version=bible.abbr,
                 )
                 for verse in get(data, 'verses', [])
@@ -20,8 +20,6 @@ _whitespace_re: Final = re.compile(re.one_or_more(re.WHITESPACE))
 _punctuation_re: Final = re.compile(
     re.one_or_more(re.WHITESPACE), re.capture(r'[,.;:]'), re.one_or_more(re.WHITESPACE)
 )
-_bold_re: Final = re.compile(r'__BOLD__')
-_italic_re: Final = re.compile(r'__ITALIC__')
 _specials_re: Final = re.compile(re.capture(r'[\*`]'))
 _number_re: Final = re.compile(
     re.capture(r'\*\*', re.one_or_more(re.DIGIT), re.DOT, r'\*\*')
@@ -45,8 +43,7 @@ class BaseService:
         text = _whitespace_re.sub(' ', text.strip())
         text = _punctuation_re.sub(r'\1 ', text)
         text = _specials_re.sub(r'\\\1', text)
-        text = _bold_re.sub('**', text)
-        text = _italic_re.sub('_', text)
+        text = text.replace('__BOLD__', '**').replace('__ITALIC__', '_')
 
         if bible.rtl:
             # wrap in [RTL embedding]text[Pop directional formatting]
@@ -8,16 +8,26 @@ from botus_receptus import re
 from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
 from yarl import URL
 
-from ..data import Passage, SearchResults, VerseRange
+from ..data import Passage, SearchResults, verse_range_from_string
 from ..exceptions import DoNotUnderstandError
 from .base_service import BaseService
 
 if TYPE_CHECKING:
+    from ..data import VerseRange
     from ..types import Bible
 
 _total_re: Final = re.compile(
     re.START, re.named_group('total')(re.one_or_more(re.DIGITS))
 )
+_passage_strainer: Final = SoupStrainer(
+    class_=re.compile(
+        re.WORD_BOUNDARY,
+        'result-text-style-',
+        re.either('normal', 'rtl'),
+        re.WORD_BOUNDARY,
+    )
+)
+_search_strainer: Final = SoupStrainer(class_=['search-result-list', 'showing-results'])
 
 
 @frozen
@@ -45,27 +55,27 @@ class BibleGateway(BaseService):
             # Remove headings and footnotes
             node.decompose()
 
-        for number in verse_node.select('span.chapternum'):
+        for number in verse_node.find_all('span', class_='chapternum'):
             number.insert_before('__BOLD__')
             number.insert_after('__BOLD__ ')
             number.string = '1.'
             number.unwrap()
-        for small_caps in verse_node.select('.small-caps'):
+        for small_caps in verse_node.find_all(class_='small-caps'):
             for descendant in list(small_caps.descendants):
                 if isinstance(descendant, NavigableString):
                     descendant.replace_with(descendant.string.upper())
             small_caps.unwrap()
-        for bold in verse_node.select('b, h4'):
+        for bold in verse_node.find_all(['b', 'h4']):
             bold.insert_before('__BOLD__')
             bold.insert_after('__BOLD__' + (' ' if bold.name == 'h4' else ''))
             bold.unwrap()
-        for number in verse_node.select('sup.versenum'):
+        for number in verse_node.find_all('sup', class_='versenum'):
             # Add a period after verse numbers
             number.insert_before('__BOLD__')
             number.insert_after('__BOLD__ ')
             number.string = f'{number.string.strip()}.'
             number.unwrap()
-        for br in verse_node.select('br'):
+        for br in verse_node.find_all('br'):
             br.replace_with('\n')
         for italic in verse_node.select('.selah, i, h3'):
             italic.insert_before('__ITALIC__')
@@ -88,15 +98,7 @@ class BibleGateway(BaseService):
             )
         ) as response:
             text = await response.text(errors='replace')
-            strainer = SoupStrainer(
-                class_=re.compile(
-                    re.WORD_BOUNDARY,
-                    'result-text-style-',
-                    re.either('normal', 'rtl'),
-                    re.WORD_BOUNDARY,
-                )
-            )
-            soup = BeautifulSoup(text, 'html.parser', parse_only=strainer)
+            soup = BeautifulSoup(text, 'lxml', parse_only=_passage_strainer)
             verse_block = soup.select_one(
                 '.result-text-style-normal, .result-text-style-rtl'
             )
@@ -128,11 +130,10 @@ class BibleGateway(BaseService):
             )
         ) as response:
             text = await response.text(errors='replace')
-            strainer = SoupStrainer(class_=['search-result-list', 'showing-results'])
-            soup = BeautifulSoup(text, 'html.parser', parse_only=strainer)
+            soup = BeautifulSoup(text, 'lxml', parse_only=_search_strainer)
 
             verse_nodes = soup.select('.search-result-list .bible-item')
-            total_node = soup.select_one('.showing-results')
+            total_node = soup.find(class_='showing-results')
 
             if not verse_nodes or total_node is None:
                 return SearchResults([], 0)
@@ -141,17 +142,17 @@ class BibleGateway(BaseService):
                 raise DoNotUnderstandError
 
             def mapper(node: Tag, /) -> Passage:
-                extras_node = node.select_one('.bible-item-extras')
+                extras_node = node.find(class_='bible-item-extras')
                 if extras_node:
                     extras_node.decompose()
 
-                verse_text_node = node.select_one('.bible-item-text')
-                verse_reference_node = node.select_one('.bible-item-title')
+                verse_text_node = node.find(class_='bible-item-text')
+                verse_reference_node = node.find(class_='bible-item-title')
 
                 if verse_text_node is None or verse_reference_node is None:
                     raise DoNotUnderstandError
 
-                verse = VerseRange.from_string(verse_reference_node.string.strip())
+                verse = verse_range_from_string(verse_reference_node.string.strip())
 
                 return self.__transform_verse_node(
                     bible, verse, verse_text_node, for_search=True
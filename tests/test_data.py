@@ -2,13 +2,21 @@ from __future__ import annotations
 
 from itertools import chain
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, TypedDict
+from typing import TYPE_CHECKING, Any, TypedDict, cast
 
 import orjson
 import pytest
 
 from erasmus import data
-from erasmus.data import Book, Passage, SearchResults, SectionFlag, Verse, VerseRange
+from erasmus.data import (
+    Book,
+    Passage,
+    SearchResults,
+    SectionFlag,
+    Verse,
+    VerseRange,
+    verse_range_from_string,
+)
 from erasmus.exceptions import (
     BookMappingInvalid,
     BookNotUnderstoodError,
@@ -281,12 +289,21 @@ class TestVerseRange:
         assert str(passage) == expected
 
     @pytest.mark.parametrize(
-        'passage_str', ['asdfc083u4r', 'Gen 1', 'Gen 1:', 'Gen 1:1 -', 'Gen 1:1 - 2:']
+        'passage_str',
+        ['asdfc083u4r', 'Gen 1', 'Gen 1:', 'Gen 1:1 -', 'Gen 1:1 - 2:', 'Gen 1:1\n'],
     )
     def test_from_string_raises(self, passage_str: str) -> None:
         with pytest.raises(ReferenceNotUnderstoodError):
             VerseRange.from_string(passage_str)
 
+    def test_verse_range_from_string(self) -> None:
+        passage = verse_range_from_string('1Pet 3:1 - 4:5')
+        assert passage == VerseRange.from_string('1Pet 3:1 - 4:5')
+        assert verse_range_from_string('1Pet 3:1 - 4:5') is passage
+
+        with pytest.raises(ReferenceNotUnderstoodError):
+            verse_range_from_string('Gen 1:')
+
     @pytest.mark.parametrize(
         'passage_str,expected_range,expected_version',
         [
@@ -324,6 +341,8 @@ class TestVerseRange:
             'Gen 1:1 -',
             'Gen 1:1 - 2:',
             'Gen 1:1 asdf qwer',
+            'Gen 1:1\n',
+            'Gen 1:1 asdf\n',
         ],
     )
     def test_from_string_with_version_raises(self, passage_str: str) -> None:
@@ -333,6 +352,10 @@ class TestVerseRange:
     @pytest.mark.parametrize(
         'passage_str,expected',
         [
+            (
+                'foo 1 John bar',
+                [cast('list[VerseRange]', []), cast('list[VerseRange]', [])],
+            ),
             ('foo 1 John 1:1 bar', [[VerseRange.create('1 John', Verse(1, 1))], []]),
             (
                 'foo 1 John 1:1 bar Mark 2:1-4 baz',
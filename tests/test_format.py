@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import pytest
+
+from erasmus.format import alpha_to_int, int_to_alpha, int_to_roman, roman_to_int
+
+
+@pytest.mark.parametrize(
+    'number,expected',
+    [
+        (1, 'I'),
+        (3, 'III'),
+        (4, 'IV'),
+        (5, 'V'),
+        (9, 'IX'),
+        (14, 'XIV'),
+        (19, 'XIX'),
+        (33, 'XXXIII'),
+        (40, 'XL'),
+        (49, 'XLIX'),
+        (90, 'XC'),
+        (99, 'XCIX'),
+        (400, 'CD'),
+        (444, 'CDXLIV'),
+        (900, 'CM'),
+        (1994, 'MCMXCIV'),
+        (3999, 'MMMCMXCIX'),
+        (4000, 'MMMM'),
+    ],
+)
+def test_int_to_roman(number: int, expected: str) -> None:
+    assert int_to_roman(number) == expected
+    assert roman_to_int(expected) == number
+
+
+@pytest.mark.parametrize(
+    'numerals,expected',
+    [
+        ('i', 1),
+        ('iv', 4),
+        ('xiv', 14),
+        ('xlix', 49),
+        ('McMxCiV', 1994),
+        ('mmmcmxcix', 3999),
+    ],
+)
+def test_roman_to_int_ignores_case(numerals: str, expected: int) -> None:
+    assert roman_to_int(numerals) == expected
+
+
+def test_roman_round_trip() -> None:
+    for number in range(1, 4000):
+        assert roman_to_int(int_to_roman(number)) == number
+
+
+@pytest.mark.parametrize(
+    'number,expected',
+    [
+        (1, 'A'),
+        (2, 'B'),
+        (26, 'Z'),
+    ],
+)
+def test_int_to_alpha(number: int, expected: str) -> None:
+    assert int_to_alpha(number) == expected
+    assert alpha_to_int(expected) == number
+    assert alpha_to_int(expected.lower()) == number
@@ -188,6 +188,61 @@ class TestServiceManager:
         assert exc_info.value.bible == bible1
         assert exc_info.value.verses == VerseRange.from_string('Genesis 1:2')
 
+    async def test_get_passage_cached(
+        self,
+        bible1: Bible,
+        bible2: Bible,
+        service_one: MockService,
+        service_two: MockService,
+    ) -> None:
+        manager = ServiceManager({'ServiceOne': service_one, 'ServiceTwo': service_two})
+        service_one.get_passage.return_value = Passage(
+            'blah', VerseRange.from_string('Genesis 1:2'), version='BIB1'
+        )
+        service_two.get_passage.return_value = Passage(
+            'blah', VerseRange.from_string('Genesis 1:2'), version='BIB2'
+        )
+
+        result1 = await manager.get_passage(
+            bible1, VerseRange.from_string('Genesis 1:2')
+        )
+        result2 = await manager.get_passage(
+            bible1, VerseRange.from_string('Genesis 1:2')
+        )
+        result3 = await manager.get_passage(
+            bible2, VerseRange.from_string('Genesis 1:2')
+        )
+
+        assert result1 is result2
+        assert result3 == Passage('blah', VerseRange.from_string('Genesis 1:2'), 'BIB2')
+        service_one.get_passage.assert_called_once_with(
+            bible1, VerseRange.from_string('Genesis 1:2')
+        )
+        service_two.get_passage.assert_called_once_with(
+            bible2, VerseRange.from_string('Genesis 1:2')
+        )
+
+        manager.clear_cache()
+        await manager.get_passage(bible1, VerseRange.from_string('Genesis 1:2'))
+
+        assert service_one.get_passage.call_count == 2
+
+    async def test_get_passage_cache_size(
+        self,
+        bible1: Bible,
+        service_one: MockService,
+    ) -> None:
+        manager = ServiceManager({'ServiceOne': service_one}, cache_size=1)
+        service_one.get_passage.return_value = Passage(
+            'blah', VerseRange.from_string('Genesis 1:2'), version='BIB1'
+        )
+
+        await manager.get_passage(bible1, VerseRange.from_string('Genesis 1:2'))
+        await manager.get_passage(bible1, VerseRange.from_string('Genesis 1:3'))
+        await manager.get_passage(bible1, VerseRange.from_string('Genesis 1:2'))
+
+        assert service_one.get_passage.call_count == 3
+
     async def test_search(
         self,
         bible1: Bible,